@@ -279,6 +279,18 @@ KEYWORD_DATABASE = {
 }
 
 
+_LOAD_KEYWORD_SQL = """
+    INSERT INTO trends (
+        keyword, category, region, trend_score,
+        search_volume, status, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, NOW())
+    ON CONFLICT (keyword) DO UPDATE
+    SET category = EXCLUDED.category,
+        trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score),
+        status = 'ready'
+"""
+
+
 @router.post("/load-keywords")
 async def load_keywords(
     db_pool: DatabasePool = Depends(get_db_pool)
@@ -300,38 +312,24 @@ async def load_keywords(
         
         logger.info(f"🚀 Starting keyword load: {total_categories} categories")
         
-        for category_name, keywords in KEYWORD_DATABASE.items():
-            category_count = 0
-            
-            for keyword in keywords:
+        async with db_pool.acquire() as conn:
+            for category_name, keywords in KEYWORD_DATABASE.items():
+                # executemany pipelines the whole category's Bind/Execute
+                # messages instead of waiting on one round-trip per keyword
+                rows = [
+                    (keyword, category_name, "GB", 8.0, 1000, "ready")  # High score, default volume
+                    for keyword in keywords
+                ]
                 try:
-                    await db_pool.execute(
-                        """
-                        INSERT INTO trends (
-                            keyword, category, region, trend_score,
-                            search_volume, status, created_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, NOW())
-                        ON CONFLICT (keyword, region) DO UPDATE
-                        SET category = EXCLUDED.category,
-                            trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score),
-                            status = 'ready'
-                        """,
-                        keyword,
-                        category_name,
-                        "GB",
-                        8.0,  # High score for manual keywords
-                        1000,  # Default search volume
-                        "ready"
-                    )
-                    total_keywords += 1
-                    category_count += 1
-                    
+                    await conn.executemany(_LOAD_KEYWORD_SQL, rows)
+                    category_count = len(rows)
                 except Exception as e:
-                    logger.error(f"Failed to insert '{keyword}': {e}")
-                    continue
-            
-            loaded_by_category[category_name] = category_count
-            logger.info(f"✅ Category '{category_name}': {category_count} keywords")
+                    logger.error(f"Failed to load category '{category_name}': {e}")
+                    category_count = 0
+                total_keywords += category_count
+                
+                loaded_by_category[category_name] = category_count
+                logger.info(f"✅ Category '{category_name}': {category_count} keywords")
         
         logger.success(f"🎉 Keyword load complete: {total_keywords} keywords across {total_categories} categories")
         
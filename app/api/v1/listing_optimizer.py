@@ -18,6 +18,7 @@ import json
 
 from app.database import DatabasePool
 from app.dependencies import get_db_pool
+from app.utils.responses import RecordJSONResponse
 
 router = APIRouter()
 
@@ -227,11 +228,12 @@ async def get_pending_optimization(
             LIMIT $1
         """, limit)
         
-        return {
-            "products": [dict(p) for p in products],
+        # Records are encoded by orjson's default hook, not copied into dicts
+        return RecordJSONResponse({
+            "products": products,
             "total": len(products),
             "ready_for_optimization": len(products)
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error fetching pending products: {e}")
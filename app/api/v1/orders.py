@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from app.database import DatabasePool
 from app.dependencies import get_db_pool
+from app.utils.responses import RecordJSONResponse
 
 router = APIRouter()
 
@@ -8,5 +9,5 @@ router = APIRouter()
 async def get_orders(db_pool: DatabasePool = Depends(get_db_pool)):
     """Get orders"""
     query = "SELECT * FROM orders ORDER BY created_at DESC LIMIT 20"
-    results = await db_pool.fetch(query)
-    return {"orders": [dict(row) for row in results]}
+    # Records go straight to orjson; no per-row dict copy
+    return RecordJSONResponse({"orders": await db_pool.fetch(query)})
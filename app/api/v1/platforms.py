@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends
-from app.database import DatabasePool
-from app.dependencies import get_db_pool
+from fastapi import APIRouter, Response
+import orjson
 
 router = APIRouter()
 
+# The platform list is static, so it is encoded once at import time
+_PLATFORMS_BODY = orjson.dumps({"platforms": ["shopify", "etsy", "amazon"]})
+
 @router.get("/")
-async def get_platforms(db_pool: DatabasePool = Depends(get_db_pool)):
+async def get_platforms():
     """Get platform integrations"""
-    return {"platforms": ["shopify", "etsy", "amazon"]}
+    return Response(
+        content=_PLATFORMS_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=60"}
+    )
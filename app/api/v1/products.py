@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 
 from app.database import DatabasePool
 from app.dependencies import get_db_pool
+from app.utils.responses import RecordJSONResponse
 from app.utils.s3_storage import get_storage_manager
 
 router = APIRouter()
@@ -149,50 +150,51 @@ async def get_products(
         storage = get_storage_manager()
         
         for row in rows:
-            product_dict = dict(row)
-            
-            metadata = product_dict.get('metadata')
+            # Records support [] and .get() directly; no per-row dict copy
+            metadata = row.get('metadata')
             if metadata is None:
                 metadata = {}
             
             image_url = None
-            if product_dict.get('image_url'):
+            if row.get('image_url'):
                 try:
-                    s3_key = product_dict['image_url']
+                    s3_key = row['image_url']
                     if s3_key.startswith('http'):
                         image_url = s3_key
                     else:
                         image_url = storage.get_presigned_url(s3_key, expiration=3600)
                 except Exception as e:
-                    logger.warning(f"Failed to generate image URL for product {product_dict['id']}: {str(e)}")
+                    logger.warning(f"Failed to generate image URL for product {row['id']}: {str(e)}")
             
             product = {
-                "id": product_dict['id'],
-                "title": product_dict['title'],
-                "description": product_dict['description'],
-                "price": float(product_dict['base_price']),
-                "category": product_dict['category'],
-                "status": product_dict['status'],
-                "created_at": product_dict['created_at'].isoformat() if product_dict['created_at'] else None,
-                "updated_at": product_dict['updated_at'].isoformat() if product_dict['updated_at'] else None,
+                "id": row['id'],
+                "title": row['title'],
+                "description": row['description'],
+                "price": float(row['base_price']),
+                "category": row['category'],
+                "status": row['status'],
+                "created_at": row['created_at'],
+                "updated_at": row['updated_at'],
                 "metadata": metadata,
                 "artwork": {
-                    "id": product_dict.get('artwork_id'),
+                    "id": row.get('artwork_id'),
                     "image_url": image_url,
-                    "prompt": product_dict.get('prompt'),
-                    "style": product_dict.get('style'),
-                    "provider": product_dict.get('provider')
-                } if product_dict.get('artwork_id') else None
+                    "prompt": row.get('prompt'),
+                    "style": row.get('style'),
+                    "provider": row.get('provider')
+                } if row.get('artwork_id') else None
             }
             
             products.append(product)
         
-        return {
+        # orjson encodes the datetimes itself; returning the response directly
+        # also skips FastAPI's jsonable_encoder walk over every product
+        return RecordJSONResponse({
             "products": products,
             "total": total_count,
             "limit": limit,
             "offset": offset
-        }
+        })
     
     except Exception as e:
         logger.error(f"Error fetching products: {str(e)}")
@@ -233,17 +235,15 @@ async def get_product(
         if not row:
             raise HTTPException(status_code=404, detail="Product not found")
         
-        product_dict = dict(row)
-        
-        metadata = product_dict.get('metadata')
+        metadata = row.get('metadata')
         if metadata is None:
             metadata = {}
         
         image_url = None
-        if product_dict.get('image_url'):
+        if row.get('image_url'):
             try:
                 storage = get_storage_manager()
-                s3_key = product_dict['image_url']
+                s3_key = row['image_url']
                 if s3_key.startswith('http'):
                     image_url = s3_key
                 else:
@@ -251,24 +251,24 @@ async def get_product(
             except Exception as e:
                 logger.warning(f"Failed to generate image URL: {str(e)}")
         
-        return {
-            "id": product_dict['id'],
-            "title": product_dict['title'],
-            "description": product_dict['description'],
-            "price": float(product_dict['base_price']),
-            "category": product_dict['category'],
-            "status": product_dict['status'],
-            "created_at": product_dict['created_at'].isoformat() if product_dict['created_at'] else None,
-            "updated_at": product_dict['updated_at'].isoformat() if product_dict['updated_at'] else None,
+        return RecordJSONResponse({
+            "id": row['id'],
+            "title": row['title'],
+            "description": row['description'],
+            "price": float(row['base_price']),
+            "category": row['category'],
+            "status": row['status'],
+            "created_at": row['created_at'],
+            "updated_at": row['updated_at'],
             "metadata": metadata,
             "artwork": {
-                "id": product_dict.get('artwork_id'),
+                "id": row.get('artwork_id'),
                 "image_url": image_url,
-                "prompt": product_dict.get('prompt'),
-                "style": product_dict.get('style'),
-                "provider": product_dict.get('provider')
-            } if product_dict.get('artwork_id') else None
-        }
+                "prompt": row.get('prompt'),
+                "style": row.get('style'),
+                "provider": row.get('provider')
+            } if row.get('artwork_id') else None
+        })
     
     except HTTPException:
         raise
@@ -1,9 +1,13 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from typing import Optional
 import httpx
+import asyncio
+import orjson
 import re
 import boto3
 import base64
+import gzip
 from urllib.parse import urlparse, unquote
 from app.database import db_pool
 from app.config import settings
@@ -11,6 +15,21 @@ from loguru import logger
 
 router = APIRouter()
 
+# Pre-signed / regular S3 URL (key up to the query string) or s3:// URI
+_S3_KEY_RE = re.compile(r'amazonaws\.com/(?P<a>[^?]+)(?:\?|$)|s3://[^/]+/(?P<b>.+)')
+
+# Hot upload queries. asyncpg keeps a per-connection prepared statement
+# cache keyed by SQL text, so issuing these exact strings every time skips
+# the server-side parse/plan after a connection's first upload
+_UPLOAD_PRODUCT_SQL = """
+    SELECT p.id, p.title, p.description, p.sku, p.base_price, 
+           a.image_url, a.style
+    FROM products p
+    LEFT JOIN artwork a ON p.artwork_id = a.id
+    WHERE p.id = $1 AND p.status = 'approved'
+"""
+_MARK_ACTIVE_SQL = "UPDATE products SET status = 'active' WHERE id = $1"
+
 class ShopifyUploadRequest(BaseModel):
     product_id: int
 
@@ -18,47 +37,72 @@ def extract_s3_key_from_url(url: str) -> str:
     """Extract S3 key from pre-signed URL, regular URL, or just return if it's already a key"""
     # If it's already just a key (no http/https), return it
     if not url.startswith(('http://', 'https://', 's3://')):
-        logger.info(f"📌 Using direct S3 key: {url}")
+        logger.debug("📌 Using direct S3 key: {}", url)
         return url
     
-    # Try to extract from full URLs
-    patterns = [
-        r'amazonaws\.com/(.+?)\?',  # Pre-signed URL
-        r'amazonaws\.com/(.+)$',     # Regular S3 URL without params
-        r's3://[^/]+/(.+)',          # s3:// URI
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    if 'amazonaws.com' in url or url.startswith('s3://'):
+        match = _S3_KEY_RE.search(url)
         if match:
-            key = unquote(match.group(1))  # URL decode
-            logger.info(f"📌 Extracted S3 key: {key}")
+            key = unquote(match.group('a') or match.group('b'))  # URL decode
+            logger.debug("📌 Extracted S3 key: {}", key)
             return key
     
-    logger.error(f"❌ Could not extract S3 key from URL: {url[:100]}...")
+    logger.error("❌ Could not extract S3 key from URL: {}...", url[:100])
     return None
 
-async def download_s3_image_as_base64(image_url: str) -> str:
-    """Download image from S3 using boto3 and convert to base64"""
-    s3_key = extract_s3_key_from_url(image_url)
-    if not s3_key:
-        raise ValueError("Could not extract S3 key from URL")
-    
-    logger.info(f"📸 Downloading from S3...")
-    
-    s3_client = boto3.client('s3',
-        region_name='eu-north-1',
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+# Request bodies above this size are gzip-compressed before sending
+GZIP_MIN_BYTES = 64 * 1024
+
+# Shopify rejects base64 attachments over ~9MB; base64 inflates by 4/3
+MAX_IMAGE_BYTES = 9 * 1024 * 1024 * 3 // 4
+
+_s3_client = None
+
+def _get_s3_client():
+    """Create the boto3 S3 client once; clients are thread-safe and costly to build"""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client('s3',
+            region_name='eu-north-1',
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+        )
+    return _s3_client
+
+def _download_s3_object(s3_key: str) -> Optional[bytes]:
+    """
+    Blocking S3 GET - run in a worker thread, never directly on the event loop.
+    A HEAD request checks the size first so oversized images are never downloaded.
+    """
+    s3_client = _get_s3_client()
+    
+    head = s3_client.head_object(
+        Bucket='ai-pod-platform-images',
+        Key=s3_key
     )
+    if head['ContentLength'] > MAX_IMAGE_BYTES:
+        logger.warning("⚠️ Image too large ({:.2f}MB raw), skipping download", head['ContentLength'] / (1024 * 1024))
+        return None
     
     response = s3_client.get_object(
         Bucket='ai-pod-platform-images',
         Key=s3_key
     )
+    return response['Body'].read()
+
+async def download_s3_image_as_base64(image_url: str) -> Optional[str]:
+    """Download image from S3 using boto3 and convert to base64 (None if too large)"""
+    s3_key = extract_s3_key_from_url(image_url)
+    if not s3_key:
+        raise ValueError("Could not extract S3 key from URL")
+    
+    logger.debug("📸 Downloading from S3...")
     
-    image_data = response['Body'].read()
-    base64_image = base64.b64encode(image_data).decode('utf-8')
+    # boto3 is synchronous; keep the download and encoding off the event loop
+    image_data = await asyncio.to_thread(_download_s3_object, s3_key)
+    if image_data is None:
+        return None
+    base64_image = await asyncio.to_thread(lambda: base64.b64encode(image_data).decode('utf-8'))
     
     # Return ONLY base64 string (no data URI prefix) for Shopify
     return base64_image
@@ -73,24 +117,14 @@ async def upload_to_shopify(request: ShopifyUploadRequest):
     if not shop_url or not access_token:
         raise HTTPException(400, "Shopify credentials not configured")
     
+    # One JOIN does both the approval check and the fetch. The row isn't
+    # memoized: approval can be revoked or the artwork replaced at any time,
+    # and re-checking that would cost as much as this query
     async with db_pool.pool.acquire() as conn:
-        # Check product status
-        check = await conn.fetchrow("SELECT id, status FROM products WHERE id = $1", request.product_id)
-        logger.info(f"🔍 Product {request.product_id} - Status: {check['status'] if check else 'NOT FOUND'}")
-        
-        product = await conn.fetchrow(
-            """
-            SELECT p.id, p.title, p.description, p.sku, p.base_price, 
-                   a.image_url, a.style
-            FROM products p
-            LEFT JOIN artwork a ON p.artwork_id = a.id
-            WHERE p.id = $1 AND p.status = 'approved'
-            """,
-            request.product_id
-        )
+        product = await conn.fetchrow(_UPLOAD_PRODUCT_SQL, request.product_id)
     
     if not product:
-        raise HTTPException(404, f"Product {request.product_id} not found or not approved (status: {check['status'] if check else 'N/A'})")
+        raise HTTPException(404, f"Product {request.product_id} not found or not approved")
     
     # Generate SKU if missing
     sku = product['sku'] or f"CWA{request.product_id}"
@@ -99,21 +133,21 @@ async def upload_to_shopify(request: ShopifyUploadRequest):
     base64_image = None
     if product['image_url']:
         try:
-            logger.info(f"🖼️ Image URL: {product['image_url'][:100]}...")
+            logger.debug("🖼️ Image URL: {}...", product['image_url'][:100])
             base64_image = await download_s3_image_as_base64(product['image_url'])
             
-            # Check size (Shopify limit is ~10MB for base64)
-            size_mb = len(base64_image) / (1024 * 1024)
-            logger.info(f"✅ Image downloaded successfully ({len(base64_image)} chars, ~{size_mb:.2f}MB)")
-            
-            if size_mb > 9:
-                logger.warning(f"⚠️ Image too large ({size_mb:.2f}MB), Shopify may reject it")
-                base64_image = None  # Don't send oversized images
+            if base64_image:
+                # Lazy args: the size is only computed when DEBUG is enabled
+                logger.opt(lazy=True).debug(
+                    "✅ Image downloaded successfully ({} chars, ~{:.2f}MB)",
+                    lambda: len(base64_image),
+                    lambda: len(base64_image) / (1024 * 1024)
+                )
         except Exception as e:
-            logger.error(f"❌ Failed to download image: {e}")
+            logger.error("❌ Failed to download image: {}", e)
             base64_image = None
     else:
-        logger.warning(f"⚠️ No image URL for product {request.product_id}")
+        logger.warning("⚠️ No image URL for product {}", request.product_id)
     
     shopify_product = {
         "product": {
@@ -134,42 +168,49 @@ async def upload_to_shopify(request: ShopifyUploadRequest):
     
     if base64_image:
         shopify_product['product']['images'] = [{"attachment": base64_image}]
-        logger.info(f"📸 Image attached to product")
+        logger.debug("📸 Image attached to product")
     else:
-        logger.warning(f"⚠️ No image will be uploaded for product {request.product_id}")
+        logger.warning("⚠️ No image will be uploaded for product {}", request.product_id)
+    
+    headers = {
+        "X-Shopify-Access-Token": access_token,
+        "Content-Type": "application/json"
+    }
+    body = orjson.dumps(shopify_product)
+    if len(body) > GZIP_MIN_BYTES:
+        # Level 1 keeps CPU low; most of the win is on the JSON envelope
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
     
     try:
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 f"https://{shop_url}/admin/api/2024-01/products.json",
-                headers={
-                    "X-Shopify-Access-Token": access_token,
-                    "Content-Type": "application/json"
-                },
-                json=shopify_product,
+                headers=headers,
+                content=body,
                 timeout=30.0
             )
             
             if response.status_code == 201:
-                shopify_data = response.json()
-                logger.info(f"✅ Product {request.product_id} uploaded to Shopify")
-                logger.info(f"   Shopify Product ID: {shopify_data['product']['id']}")
+                shopify_data = orjson.loads(response.content)
+                logger.info(
+                    "✅ Product {} uploaded to Shopify (Shopify Product ID: {})",
+                    request.product_id, shopify_data['product']['id']
+                )
                 
                 images = shopify_data['product'].get('images', [])
-                logger.info(f"   Images in response: {len(images)}")
+                logger.debug("   Images in response: {}", len(images))
                 
                 if len(images) == 0 and base64_image:
-                    logger.error(f"   ⚠️ IMAGE REJECTED BY SHOPIFY!")
-                    logger.error(f"   Base64 size: {len(base64_image) / (1024*1024):.2f}MB")
-                    logger.error(f"   Check Shopify API docs for image requirements")
+                    logger.error(
+                        "   ⚠️ IMAGE REJECTED BY SHOPIFY! Base64 size: {:.2f}MB - check Shopify API docs for image requirements",
+                        len(base64_image) / (1024 * 1024)
+                    )
                 
                 # Update product status to 'active' so it doesn't appear in queue again
                 async with db_pool.pool.acquire() as conn:
-                    await conn.execute(
-                        "UPDATE products SET status = 'active' WHERE id = $1",
-                        request.product_id
-                    )
-                logger.info(f"   ✅ Product status updated to 'active'")
+                    await conn.execute(_MARK_ACTIVE_SQL, request.product_id)
+                logger.debug("   ✅ Product status updated to 'active'")
                 
                 return {
                     "success": True,
@@ -179,11 +220,11 @@ async def upload_to_shopify(request: ShopifyUploadRequest):
                     "sku": sku
                 }
             else:
-                logger.error(f"❌ Shopify upload failed: {response.text}")
+                logger.error("❌ Shopify upload failed: {}", response.text)
                 raise HTTPException(400, f"Shopify API error: {response.text}")
                 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ Error uploading to Shopify: {e}")
+        logger.error("❌ Error uploading to Shopify: {}", e)
         raise HTTPException(500, f"Upload failed: {str(e)}")
@@ -19,9 +19,13 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     API_V1_PREFIX: str = "/api/v1"
     DOMAIN: str = "localhost"
+    MAX_REQUEST_BODY_BYTES: int = 8 * 1024 * 1024
     
     # Database (Railway will set this)
     DATABASE_URL: str = ""
+    DB_POOL_MIN_SIZE: int = 10
+    DB_POOL_MAX_SIZE: int = 50
+    DB_STATEMENT_CACHE_SIZE: int = 1024
     
     # Redis (Railway will set this)
     REDIS_URL: str = ""
@@ -21,12 +21,27 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from loguru import logger
 import asyncio
+import json
 from dataclasses import dataclass
 
 from app.database import DatabasePool
 from app.core.trends.google_trends import get_trends_analyzer
 
 
+_FIND_RECENT_TREND_SQL = """
+    SELECT id FROM trends 
+    WHERE LOWER(keyword) = LOWER($1)
+    AND created_at > NOW() - INTERVAL '7 days'
+"""
+
+_INSERT_ANALYZED_TREND_SQL = """
+    INSERT INTO trends (
+        keyword, search_volume, trend_score,
+        region, category, data
+    ) VALUES ($1, $2, $3, $4, $5, $6::jsonb)
+"""
+
+
 @dataclass
 class TrendScore:
     """Intelligent scoring for trend prioritization"""
@@ -281,52 +296,43 @@ class IntelligentTrendAnalyzer:
         """
         stored_count = 0
         
-        for trend in scored_trends[:max_to_store]:
-            try:
-                # Check if already exists
-                existing = await self.db_pool.fetchval(
-                    """
-                    SELECT id FROM trends 
-                    WHERE LOWER(keyword) = LOWER($1)
-                    AND created_at > NOW() - INTERVAL '7 days'
-                    """,
-                    trend.keyword
-                )
-                
-                if existing:
-                    logger.debug(f"Trend already exists: {trend.keyword}")
+        # One connection for the whole loop, and the same statement text every
+        # iteration, so asyncpg's statement cache parses each one only once
+        async with self.db_pool.acquire() as conn:
+            for trend in scored_trends[:max_to_store]:
+                try:
+                    # Check if already exists
+                    existing = await conn.fetchval(_FIND_RECENT_TREND_SQL, trend.keyword)
+                    
+                    if existing:
+                        logger.debug(f"Trend already exists: {trend.keyword}")
+                        continue
+                    
+                    # Store new trend
+                    await conn.execute(
+                        _INSERT_ANALYZED_TREND_SQL,
+                        trend.keyword,
+                        trend.search_volume,
+                        trend.final_score,  # Use intelligent score
+                        'GB',
+                        'auto-analyzed',
+                        json.dumps({
+                            'sources': trend.sources,
+                            'rising': trend.rising_status,
+                            'competition': trend.competition,
+                            'etsy_volume': trend.etsy_search_volume,
+                            'pinterest_interest': trend.pinterest_interest,
+                            'seasonal_boost': trend.seasonal_boost,
+                            'analyzed_at': datetime.utcnow().isoformat()
+                        })
+                    )
+                    
+                    stored_count += 1
+                    logger.info(f"✅ Stored: {trend.keyword} (score: {trend.final_score:.2f}, volume: {trend.search_volume:,})")
+                    
+                except Exception as e:
+                    logger.error(f"Error storing trend {trend.keyword}: {e}")
                     continue
-                
-                # Store new trend
-                await self.db_pool.execute(
-                    """
-                    INSERT INTO trends (
-                        keyword, search_volume, trend_score,
-                        geography, category, data
-                    ) VALUES ($1, $2, $3, $4, $5, $6)
-                    """,
-                    trend.keyword,
-                    trend.search_volume,
-                    trend.final_score,  # Use intelligent score
-                    'GB',
-                    'auto-analyzed',
-                    {
-                        'sources': trend.sources,
-                        'rising': trend.rising_status,
-                        'competition': trend.competition,
-                        'etsy_volume': trend.etsy_search_volume,
-                        'pinterest_interest': trend.pinterest_interest,
-                        'seasonal_boost': trend.seasonal_boost,
-                        'analyzed_at': datetime.utcnow().isoformat()
-                    }
-                )
-                
-                stored_count += 1
-                logger.info(f"✅ Stored: {trend.keyword} (score: {trend.final_score:.2f}, volume: {trend.search_volume:,})")
-                
-            except Exception as e:
-                logger.error(f"Error storing trend {trend.keyword}: {e}")
-                continue
         
         return stored_count
     
@@ -6,12 +6,19 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from loguru import logger
 import asyncio
+import asyncpg
+import bisect
 import json
 
 from app.database import DatabasePool
 from app.core.trends.google_trends import get_trends_analyzer
 from app.core.trends.keyword_planner import get_keyword_planner
 
+# Search volume thresholds and the designs allocated at or above each one;
+# volumes below 2000 get DESIGNS_FOR_VOLUME[0]
+VOLUME_THRESHOLDS = [2000, 5000, 10000, 20000, 30000, 50000]
+DESIGNS_FOR_VOLUME = [5, 10, 20, 30, 50, 75, 100]
+
 
 class TrendService:
     """Service for comprehensive trend research and product opportunity identification"""
@@ -67,54 +74,78 @@ class TrendService:
         # Score and filter
         scored_trends = self._score_trends_for_pod(trending_topics)
         
-        # Store in database
+        candidates = scored_trends[:limit]
+        
+        # Look up every recently stored candidate in one query instead of
+        # one SELECT per topic (served by idx_trends_keyword_lower)
+        recent_rows = await self.db_pool.fetch(
+            """
+            SELECT LOWER(keyword) AS keyword FROM trends 
+            WHERE LOWER(keyword) = ANY($1::text[])
+            AND created_at > NOW() - INTERVAL '7 days'
+            """,
+            [t['keyword'].lower() for t in candidates]
+        )
+        seen_keywords = {row['keyword'] for row in recent_rows}
+        
+        new_topics = []
+        for topic in candidates:
+            keyword_lower = topic['keyword'].lower()
+            if keyword_lower in seen_keywords:
+                logger.debug(f"Trend already exists: {topic['keyword']}")
+                continue
+            seen_keywords.add(keyword_lower)
+            new_topics.append(topic)
+        
+        # Store in database - every new topic in a single INSERT
         stored_trends = []
-        for topic in scored_trends[:limit]:
+        if new_topics:
+            fetched_at = datetime.utcnow().isoformat()
             try:
-                existing = await self.db_pool.fetchval(
-                    """
-                    SELECT id FROM trends 
-                    WHERE LOWER(keyword) = LOWER($1)
-                    AND created_at > NOW() - INTERVAL '7 days'
-                    """,
-                    topic['keyword']
-                )
-                
-                if existing:
-                    logger.debug(f"Trend already exists: {topic['keyword']}")
-                    continue
-                
-                # Convert dict to JSON string
-                data_json = json.dumps({
-                    'is_rising': topic.get('is_rising', False),
-                    'competition': topic.get('competition', 'medium'),
-                    'cpc': topic.get('cpc', 0),
-                    'fetched_at': datetime.utcnow().isoformat(),
-                    'source': 'google_trends',
-                    'pod_suitable': True,
-                    'designs_allocated': self._calculate_designs_for_volume(
-                        topic.get('search_volume', 10000)
-                    )
-                })
-                
-                trend_id = await self.db_pool.fetchval(
+                rows = await self.db_pool.fetch(
                     """
                     INSERT INTO trends (
                         keyword, search_volume, trend_score, 
-                        geography, category, data
-                    ) VALUES ($1, $2, $3, $4, $5, $6::jsonb)
-                    RETURNING id
+                        region, category, data
+                    )
+                    SELECT k, v, s, g, c, d::jsonb
+                    FROM unnest($1::text[], $2::int[], $3::float8[], $4::text[], $5::text[], $6::text[])
+                        AS t(k, v, s, g, c, d)
+                    ON CONFLICT (keyword) DO NOTHING
+                    RETURNING id, keyword
                     """,
-                    topic['keyword'],
-                    topic.get('search_volume', 10000),
-                    topic['pod_score'],
-                    topic.get('geography', region),
-                    topic.get('category', 'general'),
-                    data_json
+                    [t['keyword'] for t in new_topics],
+                    [t.get('search_volume', 10000) for t in new_topics],
+                    [t['pod_score'] for t in new_topics],
+                    [t.get('geography', region) for t in new_topics],
+                    [t.get('category', 'general') for t in new_topics],
+                    [
+                        json.dumps({
+                            'is_rising': t.get('is_rising', False),
+                            'competition': t.get('competition', 'medium'),
+                            'cpc': t.get('cpc', 0),
+                            'fetched_at': fetched_at,
+                            'source': 'google_trends',
+                            'pod_suitable': True,
+                            'designs_allocated': self._calculate_designs_for_volume(
+                                t.get('search_volume', 10000)
+                            )
+                        })
+                        for t in new_topics
+                    ]
                 )
+            except asyncpg.PostgresError:
+                logger.exception("Error storing trends")
+                rows = []
+            
+            ids = {row['keyword']: row['id'] for row in rows}
+            for topic in new_topics:
+                if topic['keyword'] not in ids:
+                    # Stored more than 7 days ago - the unique constraint skipped it
+                    continue
                 
                 stored_trends.append({
-                    'id': trend_id,
+                    'id': ids[topic['keyword']],
                     'keyword': topic['keyword'],
                     'search_volume': topic.get('search_volume', 10000),
                     'trend_score': topic['pod_score'],
@@ -126,30 +157,13 @@ class TrendService:
                     f"(score: {topic['pod_score']:.1f}, "
                     f"volume: {topic.get('search_volume', 'N/A')})"
                 )
-                
-            except Exception as e:
-                logger.error(f"Error storing trend '{topic['keyword']}': {e}")
-                continue
         
         logger.info(f"📦 Stored {len(stored_trends)} new trends")
         return stored_trends
     
     def _calculate_designs_for_volume(self, volume: int) -> int:
         """Calculate how many designs to allocate based on search volume"""
-        if volume >= 50000:
-            return 100
-        elif volume >= 30000:
-            return 75
-        elif volume >= 20000:
-            return 50
-        elif volume >= 10000:
-            return 30
-        elif volume >= 5000:
-            return 20
-        elif volume >= 2000:
-            return 10
-        else:
-            return 5
+        return DESIGNS_FOR_VOLUME[bisect.bisect_right(VOLUME_THRESHOLDS, volume)]
     
     def _score_trends_for_pod(self, trends: List[Dict]) -> List[Dict]:
         """Score trends for POD suitability"""
@@ -18,9 +18,15 @@ class DatabasePool:
         try:
             self.pool = await asyncpg.create_pool(
                 dsn=settings.DATABASE_URL,
-                min_size=5,
-                max_size=20,
-                command_timeout=60
+                # Warm connections cover the dashboard's parallel polls without
+                # waiting on acquire(); the cap stays well under Postgres' limit
+                min_size=settings.DB_POOL_MIN_SIZE,
+                max_size=settings.DB_POOL_MAX_SIZE,
+                command_timeout=60,
+                # Prepared statement LRU per connection; large enough to hold
+                # every hot query the API issues, and never expired by age
+                statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+                max_cached_statement_lifetime=0
             )
             logger.info("Database pool initialized successfully")
         except Exception as e:
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from loguru import logger
 from app.routers import admin_routes
@@ -8,6 +9,7 @@ import sys
 from app.config import settings
 from app.database import db_pool
 from app.utils.cache import redis_client
+from app.utils.body_limit import BodySizeLimitMiddleware
 from app.api.v1 import debug  # Add this to your imports
 from app.api.v1 import shopify
 
@@ -59,9 +61,13 @@ app = FastAPI(
     title="AI POD Platform API",
     description="AI-Powered Print-on-Demand Platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Request body cap (added before CORS so 413s still carry CORS headers)
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=settings.MAX_REQUEST_BODY_BYTES)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
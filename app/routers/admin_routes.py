@@ -4,6 +4,8 @@
 from fastapi import APIRouter, HTTPException, Depends
 import logging
 
+from app.utils.helpers import generate_sku
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -153,67 +155,6 @@ async def clean_duplicate_keywords():
     except Exception as e:
         logger.error(f"Error cleaning duplicates: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
-        
-@router.get("/clean-duplicate-keywords")
-async def clean_duplicate_keywords():
-    """
-    Removes duplicate keywords, keeping the one with highest search volume.
-    If volumes are equal, keeps the most recent.
-    """
-    try:
-        from app.database import get_db_pool
-        
-        pool = await get_db_pool()
-        
-        # Find duplicates
-        duplicates = await pool.fetch("""
-            SELECT 
-                LOWER(keyword) as normalized_keyword,
-                COUNT(*) as count,
-                ARRAY_AGG(id ORDER BY 
-                    COALESCE(search_volume, 0) DESC, 
-                    created_at DESC
-                ) as trend_ids
-            FROM trends
-            GROUP BY LOWER(keyword)
-            HAVING COUNT(*) > 1
-        """)
-        
-        if not duplicates:
-            return {
-                "success": True,
-                "duplicates_found": 0,
-                "records_deleted": 0,
-                "message": "No duplicate keywords found"
-            }
-        
-        deleted_count = 0
-        
-        for dup in duplicates:
-            # Keep first ID (highest volume/most recent), delete the rest
-            keep_id = dup['trend_ids'][0]
-            delete_ids = dup['trend_ids'][1:]
-            
-            logger.info(f"Keyword '{dup['normalized_keyword']}': keeping ID {keep_id}, deleting {len(delete_ids)} duplicates")
-            
-            # Delete duplicate records
-            result = await pool.execute("""
-                DELETE FROM trends
-                WHERE id = ANY($1::int[])
-            """, delete_ids)
-            
-            deleted_count += len(delete_ids)
-        
-        return {
-            "success": True,
-            "duplicates_found": len(duplicates),
-            "records_deleted": deleted_count,
-            "message": f"Cleaned {deleted_count} duplicate keyword entries"
-        }
-        
-    except Exception as e:
-        logger.error(f"Error cleaning duplicates: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/keyword-stats")
@@ -345,60 +286,63 @@ async def import_orphaned_images():
         # Import orphaned images as artwork
         imported_count = 0
         
-        for img in orphaned_images:
-            try:
-                # Check if trend exists for this keyword
-                trend_id = await pool.fetchval("""
-                    SELECT id FROM trends 
-                    WHERE LOWER(keyword) = LOWER($1)
-                    LIMIT 1
-                """, img['keyword'])
-                
-                # Create artwork record
-                artwork_id = await pool.fetchval("""
-                    INSERT INTO artwork (
-                        prompt, provider, style, image_url, 
-                        generation_cost, quality_score, trend_id, metadata
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb)
-                    RETURNING id
-                """,
-                    f"{img['keyword']} wall art",  # prompt
-                    'replicate-flux',  # provider
-                    'abstract',  # style (default)
-                    img['url'],  # image_url
-                    0.003,  # generation_cost
-                    7.0,  # quality_score
-                    trend_id,  # trend_id (may be null)
-                    '{"source": "s3_import", "original_folder": "' + img['folder'] + '"}'  # metadata
-                )
-                
-                # Create product for this artwork
-                from app.core.products.generator import generate_sku
-                
-                sku = generate_sku(prefix="POD")
-                
-                await pool.execute("""
-                    INSERT INTO products (
-                        sku, title, description, base_price,
-                        artwork_id, category, tags, status, image_url
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                """,
-                    sku,
-                    f"{img['keyword'].title()} - Wall Art",
-                    f"Premium artwork featuring {img['keyword']}. High-quality print perfect for home or office decor.",
-                    44.99,
-                    artwork_id,
-                    'GB',
-                    [img['keyword'], 'imported', 'wall art'],
-                    'pending',  # Status pending for review
-                    img['url']
-                )
-                
-                imported_count += 1
+        # One connection for the whole import. Each image gets its own
+        # transaction, so its artwork and product rows commit together and
+        # a failure rolls back both
+        async with pool.acquire() as conn:
+            for img in orphaned_images:
+                try:
+                    async with conn.transaction():
+                        # Check if trend exists for this keyword
+                        trend_id = await conn.fetchval("""
+                            SELECT id FROM trends 
+                            WHERE LOWER(keyword) = LOWER($1)
+                            LIMIT 1
+                        """, img['keyword'])
+                        
+                        # Create artwork record
+                        artwork_id = await conn.fetchval("""
+                            INSERT INTO artwork (
+                                prompt, provider, style, image_url, 
+                                generation_cost, quality_score, trend_id, metadata
+                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb)
+                            RETURNING id
+                        """,
+                            f"{img['keyword']} wall art",  # prompt
+                            'replicate-flux',  # provider
+                            'abstract',  # style (default)
+                            img['url'],  # image_url
+                            0.003,  # generation_cost
+                            7.0,  # quality_score
+                            trend_id,  # trend_id (may be null)
+                            '{"source": "s3_import", "original_folder": "' + img['folder'] + '"}'  # metadata
+                        )
+                        
+                        # Create product for this artwork
+                        sku = generate_sku(prefix="POD")
+                        
+                        await conn.execute("""
+                            INSERT INTO products (
+                                sku, title, description, base_price,
+                                artwork_id, category, tags, status, image_url
+                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                        """,
+                            sku,
+                            f"{img['keyword'].title()} - Wall Art",
+                            f"Premium artwork featuring {img['keyword']}. High-quality print perfect for home or office decor.",
+                            44.99,
+                            artwork_id,
+                            'GB',
+                            [img['keyword'], 'imported', 'wall art'],
+                            'pending',  # Status pending for review
+                            img['url']
+                        )
+                    
+                    imported_count += 1
                 
-            except Exception as e:
-                logger.error(f"Failed to import {img['key']}: {str(e)}")
-                continue
+                except Exception as e:
+                    logger.error(f"Failed to import {img['key']}: {str(e)}")
+                    continue
         
         return {
             "success": True,
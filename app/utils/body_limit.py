@@ -0,0 +1,43 @@
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+
+
+class BodySizeLimitMiddleware:
+    """
+    Pure ASGI middleware that refuses request bodies over max_bytes with a 413.
+    A declared Content-Length is checked before the app runs; chunked bodies
+    are counted as they are received, so an oversized upload fails as soon as
+    it crosses the cap instead of after it has been buffered.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Request body exceeds {self.max_bytes} bytes"
+
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > self.max_bytes:
+                response = ORJSONResponse({"detail": detail}, status_code=413)
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Raised inside the app's body read, so FastAPI turns it
+                    # into a normal 413 response
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -54,6 +54,41 @@ class RedisClient:
         except Exception as e:
             logger.error(f"Redis set failed: {e}")
     
+    async def set_raw(self, key: str, value: str, ttl: int = 300):
+        """Set an already-serialized value in cache"""
+        if not self.client or not self.is_connected:
+            return
+        
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.error(f"Redis set failed: {e}")
+    
+    async def incr(self, key: str) -> Optional[int]:
+        """Atomically increment a counter"""
+        if not self.client or not self.is_connected:
+            return None
+        
+        try:
+            return await self.client.incr(key)
+        except Exception as e:
+            logger.error(f"Redis incr failed: {e}")
+            return None
+    
+    async def delete_pattern(self, pattern: str):
+        """Delete every key matching a glob pattern"""
+        if not self.client or not self.is_connected:
+            return
+        
+        try:
+            keys = [key async for key in self.client.scan_iter(match=pattern)]
+            if keys:
+                # UNLINK frees the values in the background instead of
+                # blocking Redis while large cached bodies are released
+                await self.client.unlink(*keys)
+        except Exception as e:
+            logger.error(f"Redis delete_pattern failed: {e}")
+    
     async def ping(self) -> bool:
         """Check Redis connection"""
         if not self.client:
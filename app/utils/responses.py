@@ -0,0 +1,25 @@
+import asyncpg
+import orjson
+from decimal import Decimal
+from typing import Any
+from fastapi.responses import ORJSONResponse
+
+
+def record_default(obj):
+    """orjson fallback for the asyncpg types it doesn't encode natively"""
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class RecordJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that accepts asyncpg Records anywhere in the content, so
+    handlers can return fetch() results as-is instead of copying each row
+    into a dict for FastAPI's jsonable_encoder walk
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=record_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,55 @@
+import orjson
+from typing import Any, Callable, Optional
+from fastapi.responses import StreamingResponse
+from loguru import logger
+from app.utils.responses import record_default
+
+
+async def _iter_json_rows(
+    pool, query: str, args: tuple, key: Optional[str], prefetch: int,
+    next_cursor: Optional[Callable[[Any, int], Any]]
+):
+    """Yield a JSON array (optionally wrapped as {key: [...]}) one row at a time"""
+    async with pool.acquire() as conn:
+        # Server-side cursors only live inside a transaction
+        async with conn.transaction():
+            yield b'{"' + key.encode() + b'":[' if key else b'['
+            last_row = None
+            count = 0
+            try:
+                async for row in conn.cursor(query, *args, prefetch=prefetch):
+                    chunk = orjson.dumps(row, default=record_default)
+                    yield chunk if count == 0 else b',' + chunk
+                    last_row = row
+                    count += 1
+            except Exception as e:
+                # Headers are already sent, so all we can do is log and end the body
+                logger.error(f"Error streaming rows: {e}")
+                raise
+            if next_cursor is not None:
+                yield b'],"next_cursor":' + orjson.dumps(next_cursor(last_row, count)) + b'}'
+            else:
+                yield b']}' if key else b']'
+
+
+def stream_json_rows(
+    pool, query: str, *args, key: Optional[str] = None, prefetch: int = 50,
+    next_cursor: Optional[Callable[[Any, int], Any]] = None
+) -> StreamingResponse:
+    """
+    Stream query results as JSON straight from a server-side cursor, so rows
+    are encoded as they arrive instead of being buffered as Records + dicts.
+
+    With next_cursor (requires key), next_cursor(last_row, row_count) is
+    called once the rows run out and its result is sent after the array as
+    {key: [...], "next_cursor": ...}.
+
+    The 200 status and headers go out before the first row is read, so an
+    error mid-stream can't become a 500: the connection is dropped and the
+    client sees a truncated (invalid) JSON body. Callers' try/except only
+    covers building the response, not the rows.
+    """
+    return StreamingResponse(
+        _iter_json_rows(pool, query, args, key, prefetch, next_cursor),
+        media_type="application/json"
+    )
@@ -28,7 +28,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('misty mountain', 'Mountains & Peaks', 'GB', 8.0, 1000, 'ready', NOW()),
 ('dramatic mountain', 'Mountains & Peaks', 'GB', 8.0, 1000, 'ready', NOW()),
 ('mountain silhouette', 'Mountains & Peaks', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- Oceans & Coastlines
@@ -48,7 +48,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('pier', 'Oceans & Coastlines', 'GB', 8.0, 1000, 'ready', NOW()),
 ('harbor', 'Oceans & Coastlines', 'GB', 8.0, 1000, 'ready', NOW()),
 ('bay', 'Oceans & Coastlines', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- Forests & Woodlands
@@ -63,7 +63,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('forest path', 'Forests & Woodlands', 'GB', 8.0, 1000, 'ready', NOW()),
 ('enchanted forest', 'Forests & Woodlands', 'GB', 8.0, 1000, 'ready', NOW()),
 ('misty forest', 'Forests & Woodlands', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- Flowers & Botanical
@@ -82,7 +82,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('pressed flowers', 'Flowers & Botanical', 'GB', 8.0, 1000, 'ready', NOW()),
 ('watercolor flowers', 'Flowers & Botanical', 'GB', 8.0, 1000, 'ready', NOW()),
 ('vintage flowers', 'Flowers & Botanical', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- Wildlife
@@ -102,7 +102,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('whale', 'Wildlife Animals', 'GB', 8.0, 1000, 'ready', NOW()),
 ('dolphin', 'Wildlife Animals', 'GB', 8.0, 1000, 'ready', NOW()),
 ('penguin', 'Wildlife Animals', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- ========== ABSTRACT & MODERN ==========
@@ -125,7 +125,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('marble', 'Textures & Materials', 'GB', 8.0, 1000, 'ready', NOW()),
 ('gold foil', 'Textures & Materials', 'GB', 8.0, 1000, 'ready', NOW()),
 ('rose gold', 'Textures & Materials', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- ========== TYPOGRAPHY & QUOTES ==========
@@ -149,7 +149,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('mom life', 'Family & Relationships', 'GB', 8.0, 1000, 'ready', NOW()),
 ('dad life', 'Family & Relationships', 'GB', 8.0, 1000, 'ready', NOW()),
 ('grandma', 'Family & Relationships', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- ========== ANIMALS ==========
@@ -169,7 +169,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('tabby cat', 'Cat Breeds', 'GB', 8.0, 1000, 'ready', NOW()),
 ('black cat', 'Cat Breeds', 'GB', 8.0, 1000, 'ready', NOW()),
 ('orange cat', 'Cat Breeds', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- ========== HOLIDAYS ==========
@@ -189,7 +189,7 @@ INSERT INTO trends (keyword, category, region, trend_score, search_volume, statu
 ('love heart', 'Valentines Day', 'GB', 8.0, 1000, 'ready', NOW()),
 ('easter', 'Easter', 'GB', 8.0, 1000, 'ready', NOW()),
 ('easter bunny', 'Easter', 'GB', 8.0, 1000, 'ready', NOW())
-ON CONFLICT (keyword, region) DO UPDATE 
+ON CONFLICT (keyword) DO UPDATE 
 SET category = EXCLUDED.category, trend_score = GREATEST(trends.trend_score, EXCLUDED.trend_score), status = 'ready';
 
 -- Verify insert
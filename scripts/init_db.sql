@@ -115,9 +115,22 @@ CREATE TABLE IF NOT EXISTS pod_providers (
 );
 
 -- Step 4: Create indexes for performance
-CREATE INDEX IF NOT EXISTS idx_trends_keyword ON trends(keyword);
+-- Unique keyword (also serves plain keyword lookups); the keyword
+-- upserts' ON CONFLICT (keyword) depends on it
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'trends_keyword_unique'
+    ) THEN
+        ALTER TABLE trends ADD CONSTRAINT trends_keyword_unique UNIQUE (keyword);
+    END IF;
+END $$;
+CREATE INDEX IF NOT EXISTS idx_trends_keyword_lower ON trends(LOWER(keyword));
+CREATE INDEX IF NOT EXISTS idx_trends_volume_keyset ON trends((COALESCE(search_volume, 0)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_trends_category_volume_keyset ON trends(category, (COALESCE(search_volume, 0)) DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_products_status ON products(status);
 CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders(created_at);
+CREATE INDEX IF NOT EXISTS idx_artwork_created_at ON artwork(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
 CREATE INDEX IF NOT EXISTS idx_analytics_date ON analytics_daily(date);
 
@@ -6,8 +6,17 @@ if [ -n "$DATABASE_URL" ]; then
   
   # Run the migration SQL
   psql $DATABASE_URL << 'EOF'
--- Add unique constraint to prevent duplicates
-ALTER TABLE trends ADD CONSTRAINT IF NOT EXISTS trends_keyword_unique UNIQUE (keyword);
+-- Add unique constraint to prevent duplicates (Postgres has no
+-- ADD CONSTRAINT IF NOT EXISTS, so check the catalog first). The keyword
+-- upserts' ON CONFLICT (keyword) depends on it
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'trends_keyword_unique'
+    ) THEN
+        ALTER TABLE trends ADD CONSTRAINT trends_keyword_unique UNIQUE (keyword);
+    END IF;
+END $$;
 
 -- Add design allocation tracking columns
 ALTER TABLE trends ADD COLUMN IF NOT EXISTS designs_allocated INTEGER DEFAULT 8;
@@ -18,6 +27,12 @@ ALTER TABLE trends ADD COLUMN IF NOT EXISTS last_generated_at TIMESTAMP;
 -- Create indexes for faster queries
 CREATE INDEX IF NOT EXISTS idx_trends_priority ON trends(search_volume DESC, designs_generated);
 CREATE INDEX IF NOT EXISTS idx_trends_status ON trends(status) WHERE status = 'ready';
+CREATE INDEX IF NOT EXISTS idx_trends_keyword_lower ON trends(LOWER(keyword));
+-- Superseded by idx_trends_category_volume_keyset
+DROP INDEX IF EXISTS idx_trends_category_volume;
+CREATE INDEX IF NOT EXISTS idx_trends_volume_keyset ON trends((COALESCE(search_volume, 0)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_trends_category_volume_keyset ON trends(category, (COALESCE(search_volume, 0)) DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_artwork_created_at ON artwork(created_at DESC);
 
 -- Update existing keywords with default values if they don't have them
 UPDATE trends SET designs_allocated = 8 WHERE designs_allocated IS NULL OR designs_allocated = 0;
@@ -30,5 +45,7 @@ EOF
   echo "--- Priority system migration complete ---"
 fi
 
-# Then start your app
-uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8080}
+# Then start your app (uvloop + httptools come with uvicorn[standard];
+# pin them explicitly so a missing wheel fails loudly instead of silently
+# falling back to the slower pure-asyncio loop)
+uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8080} --loop uvloop --http httptools